@@ -0,0 +1,51 @@
+"""
+Measures interpreter startup time for lightweight CLI commands.
+
+Compares importing the package the old way (all of pandas, numpy, bs4 and
+aiohttp pulled in eagerly) against running `main.py stats`, which only loads
+what it needs.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse, os, statistics, subprocess, sys, tempfile, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EAGER = (
+    "import pandas, numpy, bs4, aiohttp; "
+    "import src.models, src.api_client, src.scraper, src.utils"
+)
+
+
+def time_command(cmd, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        cases = [
+            ("bare interpreter", [sys.executable, "-c", "pass"]),
+            ("eager imports (before)", [sys.executable, "-c", EAGER]),
+            (
+                "main.py stats (lazy)",
+                [sys.executable, "main.py", "stats", "--output-dir", output_dir],
+            ),
+        ]
+        for name, cmd in cases:
+            median = time_command(cmd, args.runs)
+            print(f"{name:<26} {median * 1000:8.1f} ms (median of {args.runs})")
+
+
+if __name__ == "__main__":
+    main()
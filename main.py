@@ -1,9 +1,6 @@
 import asyncio, sys
 from dotenv import load_dotenv
 
-from src.scraper import ThirteenFScraper
-from src.utils import merge_batch_files
-
 import logging
 
 logging.basicConfig(
@@ -27,16 +24,21 @@ def prompt_user():
 
 
 def main():
+    # heavy modules (pandas, bs4, aiohttp) are only imported once an option needs them
     while True:
         choice = prompt_user()
         if choice == "1":
             # scrape of all managers and holdings.
+            from src.scraper import ThirteenFScraper
+
             logging.info("Starting full scrape. This may take a while...")
             scraper = ThirteenFScraper()
             asyncio.run(scraper.run())
             logging.info("Full scrape completed.")
         elif choice == "2":
             # merge all batch files into one final CSV.
+            from src.utils import merge_batch_files
+
             logging.info("Merging batch files into one final CSV...")
             merged_df = merge_batch_files(input_directory="data/batches")
             if merged_df is not None:
@@ -56,6 +58,8 @@ def main():
                 logging.warning("Invalid input. Please enter a single letter (A-Z).")
                 continue
 
+            from src.scraper import ThirteenFScraper
+
             logging.info(f"Starting batch scrape for managers starting with '{letter}'")
             scraper = ThirteenFScraper()
             asyncio.run(scraper.run_batch(letter))
@@ -68,4 +72,9 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # non-interactive mode, e.g. `python main.py batch A B --concurrency 50`
+        from src.cli import main as cli_main
+
+        sys.exit(cli_main())
     main()
@@ -1,7 +1,15 @@
-from .models import Manager, Filing, Holding
-from .api_client import APIClient
-from .scraper import ThirteenFScraper
-from .utils import merge_batch_files
+import importlib
+
+# Submodules pull in heavy dependencies (pandas, numpy, bs4, aiohttp), so the
+# public names are resolved lazily on first access instead of at import time.
+_LAZY_ATTRS = {
+    "Manager": ".models",
+    "Filing": ".models",
+    "Holding": ".models",
+    "APIClient": ".api_client",
+    "ThirteenFScraper": ".scraper",
+    "merge_batch_files": ".utils",
+}
 
 __all__ = [
     "Manager",
@@ -11,3 +19,15 @@ __all__ = [
     "ThirteenFScraper",
     "merge_batch_files",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
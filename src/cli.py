@@ -0,0 +1,189 @@
+import argparse, asyncio, csv, importlib.util, logging, os, sys
+
+# Only stdlib modules are imported here. Anything that pulls in pandas, bs4 or
+# aiohttp is imported inside the subcommand that needs it, so that e.g.
+# `stats` starts without loading the scraping stack.
+from src.utils import SUPPORTED_FORMATS, collect_batch_stats
+
+logger = logging.getLogger(__name__)
+
+
+def _create_scraper(args):
+    from src.scraper import ThirteenFScraper
+
+    return ThirteenFScraper(
+        output_dir=args.output_dir,
+        output_format=args.format,
+        concurrency=args.concurrency,
+        parallel_letters=args.parallel_letters,
+    )
+
+
+def cmd_scrape(args):
+    """
+    Full scrape of all managers and holdings (A-Z)
+    """
+    logger.info("Starting full scrape. This may take a while...")
+    scraper = _create_scraper(args)
+    asyncio.run(scraper.run())
+    logger.info("Full scrape completed.")
+    return 0
+
+
+def cmd_batch(args):
+    """
+    Re-scrapes one or more letter batches
+    """
+    letters = [letter.strip().upper() for letter in args.letters]
+    invalid = [l for l in letters if len(l) != 1 or not l.isalpha()]
+    if invalid:
+        logger.error(f"Invalid letter(s): {', '.join(invalid)}. Use single letters A-Z.")
+        return 2
+
+    scraper = _create_scraper(args)
+    # letters are scheduled largest first by the scraper, not in the order given
+    asyncio.run(scraper.run_batches(letters))
+    return 0
+
+
+def cmd_merge(args):
+    """
+    Merges all batch files into one final file
+    """
+    from src.utils import merge_batch_files
+
+    logger.info("Merging batch files into one final file...")
+    merged_df = merge_batch_files(
+        input_directory=os.path.join(args.output_dir, "batches"),
+        batch_pattern=f"final_*.{args.format}",
+        output_file=os.path.join(args.output_dir, f"final_merged.{args.format}"),
+        file_format=args.format,
+    )
+    if merged_df is None:
+        logger.warning("No batch files were found to merge.")
+        return 1
+    logger.info("Merge completed successfully.")
+    return 0
+
+
+def cmd_retry_failed(args):
+    """
+    Retries the holdings listed in failed_holdings.csv, rewriting only the affected managers
+    """
+    scraper = _create_scraper(args)
+    asyncio.run(scraper.retry_failed())
+    return 0
+
+
+def cmd_stats(args):
+    """
+    Prints a summary of the batch files and failed holdings on disk
+    """
+    stats = collect_batch_stats(os.path.join(args.output_dir, "batches"))
+    total_rows = 0
+    total_size = 0
+    for entry in stats:
+        rows = entry["rows"] if entry["rows"] is not None else "-"
+        print(f"{os.path.basename(entry['file'])}\t{rows}\t{entry['size_bytes']}")
+        total_rows += entry["rows"] or 0
+        total_size += entry["size_bytes"]
+    print(f"Batch files: {len(stats)}, rows: {total_rows}, bytes: {total_size}")
+
+    failed_file = os.path.join(args.output_dir, "failed_holdings.csv")
+    failed = 0
+    if os.path.exists(failed_file):
+        with open(failed_file, newline="") as f:
+            failed = sum(1 for _ in csv.DictReader(f))
+    print(f"Failed holdings: {failed}")
+    return 0
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _parquet_engine_available():
+    return any(
+        importlib.util.find_spec(engine) is not None
+        for engine in ("pyarrow", "fastparquet")
+    )
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--output-dir",
+        default="data",
+        help="Directory for batch files, merged output and failed holdings (default: data)",
+    )
+    common.add_argument(
+        "--format",
+        choices=SUPPORTED_FORMATS,
+        default="csv",
+        help="File format for batch and merged output (default: csv)",
+    )
+
+    scraping = argparse.ArgumentParser(add_help=False, parents=[common])
+    scraping.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=100,
+        help="Maximum number of simultaneous HTTP connections (default: 100)",
+    )
+    scraping.add_argument(
+        "--parallel-letters",
+        type=_positive_int,
+        default=4,
+        help="Letter batches processed at the same time, largest first (default: 4)",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="main.py", description="13F holdings scraper"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sub = subparsers.add_parser(
+        "scrape", parents=[scraping], help="Scrape all managers and holdings (A-Z)"
+    )
+    sub.set_defaults(func=cmd_scrape)
+
+    sub = subparsers.add_parser(
+        "batch", parents=[scraping], help="Re-scrape one or more letter batches"
+    )
+    sub.add_argument("letters", nargs="+", metavar="LETTER")
+    sub.set_defaults(func=cmd_batch)
+
+    sub = subparsers.add_parser(
+        "merge", parents=[common], help="Merge all batch files into one final file"
+    )
+    sub.set_defaults(func=cmd_merge)
+
+    sub = subparsers.add_parser(
+        "retry-failed",
+        parents=[scraping],
+        help="Retry the holdings listed in failed_holdings.csv",
+    )
+    sub.set_defaults(func=cmd_retry_failed)
+
+    sub = subparsers.add_parser(
+        "stats", parents=[common], help="Summarise batch files and failed holdings"
+    )
+    sub.set_defaults(func=cmd_stats)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # fail before scraping anything rather than when the first batch is written
+    if args.format == "parquet" and not _parquet_engine_available():
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import json, logging, os, time
+
+logger = logging.getLogger(__name__)
+
+
+class WorkScheduler:
+    """
+    Orders work largest-first (longest-processing-time) so a single mega-manager
+    doesn't start last and hold up the whole batch.
+
+    A manager's cost is estimated in holding rows: its current filing count times the
+    rows-per-filing observed for it in previous runs (or the average across all known
+    managers when it has no history). Observed row counts are persisted to a JSON file
+    so estimates improve from run to run.
+    """
+
+    def __init__(self, history_file="data/manager_costs.json"):
+        self.history_file = history_file
+        self.history = {}  # manager name -> {"filings": int, "rows": int}
+        if os.path.exists(history_file):
+            try:
+                with open(history_file) as f:
+                    self.history = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read cost history {history_file}: {e}")
+
+    def _default_rows_per_filing(self):
+        filings = sum(h["filings"] for h in self.history.values())
+        rows = sum(h["rows"] for h in self.history.values())
+        return rows / filings if filings else 1.0
+
+    def estimate_manager(self, manager, rows_per_filing=None):
+        """
+        Estimated number of holding rows for a manager whose filings have been fetched
+        """
+        past = self.history.get(manager.name)
+        if past and past["filings"]:
+            rate = past["rows"] / past["filings"]
+        else:
+            rate = (
+                rows_per_filing
+                if rows_per_filing is not None
+                else self._default_rows_per_filing()
+            )
+        # every filing costs at least one request, even if it yields no rows
+        return len(manager.filings) * max(rate, 1.0)
+
+    def estimate_letter(self, managers_list):
+        """
+        Estimated cost of a letter batch before any filings are fetched, based on
+        the rows previously recorded for its managers
+        """
+        # floor every manager at 1 so a letter is never estimated as free work
+        known = [
+            max(self.history[m.name]["rows"], 1.0)
+            for m in managers_list
+            if m.name in self.history
+        ]
+        fallback = sum(known) / len(known) if known else 1.0
+        return sum(
+            max(self.history[m.name]["rows"], 1.0) if m.name in self.history else fallback
+            for m in managers_list
+        )
+
+    def order_managers(self, managers_list):
+        """
+        Returns (managers, estimates) sorted by estimated cost, largest first
+        """
+        rate = self._default_rows_per_filing()
+        estimates = {id(m): self.estimate_manager(m, rate) for m in managers_list}
+        ordered = sorted(managers_list, key=lambda m: estimates[id(m)], reverse=True)
+        return ordered, [estimates[id(m)] for m in ordered]
+
+    def order_letters(self, managers_by_letter):
+        """
+        Returns a list of (letter, managers, estimate) sorted by estimated cost, largest first
+        """
+        batches = [
+            (letter, managers, self.estimate_letter(managers))
+            for letter, managers in managers_by_letter.items()
+        ]
+        return sorted(batches, key=lambda batch: batch[2], reverse=True)
+
+    def record(self, manager, filings, rows):
+        """
+        Remembers the number of rows a manager produced for future estimates
+        Keyword arguments:
+        manager: the Manager that was processed
+        filings: number of filings whose holdings were fetched successfully
+        rows: number of holding rows those filings produced
+        """
+        if not filings:
+            return
+        self.history[manager.name] = {"filings": filings, "rows": rows}
+
+    def save(self):
+        directory = os.path.dirname(self.history_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = self.history_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(self.history, f)
+        os.replace(tmp_file, self.history_file)
+
+
+class ProgressTracker:
+    """
+    Tracks completed work against the scheduler's estimates and derives an ETA
+    from the throughput observed so far.
+    """
+
+    def __init__(self, label, total_cost, total_items):
+        self.label = label
+        self.total_cost = total_cost
+        self.total_items = total_items
+        self.done_cost = 0.0
+        self.done_items = 0
+        self.start_time = time.time()
+
+    def eta_seconds(self):
+        """
+        Seconds until completion, or None until some work has finished
+        """
+        if not self.done_cost:
+            return None
+        elapsed = time.time() - self.start_time
+        remaining = max(self.total_cost - self.done_cost, 0.0)
+        return elapsed / self.done_cost * remaining
+
+    def advance(self, cost, name=None):
+        self.done_cost += cost
+        self.done_items += 1
+        eta = self.eta_seconds()
+        pct = 100 * self.done_cost / self.total_cost if self.total_cost else 100.0
+        logger.info(
+            f"[{self.label}] {self.done_items}/{self.total_items} done ({pct:.1f}% of estimated work)"
+            + (f", finished {name}" if name else "")
+            + (f", ETA {round(eta / 60, 1)} minutes" if eta is not None else "")
+        )
@@ -4,17 +4,39 @@ import aiohttp
 import pandas as pd
 import numpy as np
 from bs4 import BeautifulSoup
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from src.models import Manager, Filing, Holding
 from src.api_client import APIClient
-from src.utils import merge_batch_files
+from src.scheduler import WorkScheduler, ProgressTracker
+from src.utils import merge_batch_files, read_dataframe, write_dataframe
 
 logger = logging.getLogger(__name__)
 
 
+USER_AGENT = "Mozilla/5.0 (compatible; DataScraper/1.0)"
+
+FAILED_COLUMNS = ["fund_name", "filing_id", "quarter", "filing_date", "error"]
+RECORD_COLUMNS = [
+    "fund_name",
+    "filing_date",
+    "quarter",
+    "stock_symbol",
+    "cl",
+    "value_($000)",
+    "shares",
+]
+
+
 class ThirteenFScraper:
-    def __init__(self, output_filename="./data/final.csv"):
+    def __init__(
+        self,
+        output_filename="./data/final.csv",
+        output_dir="data",
+        output_format="csv",
+        concurrency=100,
+        parallel_letters=4,
+    ):
         try:
             # load from environment variable
             self.base_url = os.environ["BASE_URL"]
@@ -24,8 +46,133 @@ class ThirteenFScraper:
             logging.error(f"Environment variable {e} not found")
             raise e
 
-        self.output_filename = os.path.join("data", output_filename)
-        os.makedirs("data", exist_ok=True)
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.concurrency = concurrency
+        # letter batches processed at the same time; each one keeps its records in memory
+        self.parallel_letters = parallel_letters
+        self.output_filename = os.path.join(output_dir, output_filename)
+        os.makedirs(output_dir, exist_ok=True)
+        self.scheduler = WorkScheduler(os.path.join(output_dir, "manager_costs.json"))
+
+    def _create_session(self):
+        """
+        Creates the shared HTTP session, capping simultaneous connections at self.concurrency
+        """
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        return aiohttp.ClientSession(
+            connector=connector, headers={"User-Agent": USER_AGENT}
+        )
+
+    async def _run_largest_first(self, batches, handler, progress=None):
+        """
+        Runs handler(letter, items) for every batch with up to self.parallel_letters batches
+        in flight. Workers pull from the list in order, so when it is sorted largest first
+        the biggest batches start immediately and small ones fill in behind them, while all
+        of them share the session's connection limit.
+        Keyword arguments:
+        batches: a list of (letter, items, estimate) tuples, largest first
+        handler: coroutine function processing one batch
+        progress: optional ProgressTracker advanced by each batch's estimate
+        Returns the handler results in the same order as batches. A batch whose handler raised
+        gets the exception as its result instead, so one failing letter neither cancels nor
+        orphans the letters running beside it.
+        """
+        pending = deque(enumerate(batches))
+        results = [None] * len(batches)
+
+        async def worker():
+            while pending:
+                index, (letter, items, estimate) = pending.popleft()
+                try:
+                    results[index] = await handler(letter, items)
+                except Exception as e:
+                    logger.error(f"Batch for letter {letter} failed: {e}")
+                    results[index] = e
+                if progress:
+                    progress.advance(estimate, f"letter {letter}")
+
+        workers = min(self.parallel_letters, len(batches))
+        await asyncio.gather(*[worker() for _ in range(workers)])
+        return results
+
+    @staticmethod
+    def _failed_batch_records(managers_list, error):
+        """
+        Failed records for a letter batch that failed as a whole, one per manager so that
+        retry_failed re-scrapes each of them
+        """
+        return [
+            {
+                "fund_name": manager.name,
+                "filing_id": "",
+                "quarter": "all",
+                "filing_date": "",
+                "error": str(error),
+            }
+            for manager in managers_list
+        ]
+
+    @property
+    def failed_file(self):
+        return os.path.join(self.output_dir, "failed_holdings.csv")
+
+    def _batch_filename(self, letter):
+        return os.path.join(
+            self.output_dir, "batches", f"final_{letter}.{self.output_format}"
+        )
+
+    def read_failed_records(self):
+        """
+        Reads <output_dir>/failed_holdings.csv
+        Returns a list of dictionaries keyed by FAILED_COLUMNS (empty if there is no file)
+        """
+        if not os.path.exists(self.failed_file):
+            return []
+        with open(self.failed_file, newline="") as f:
+            # files written before filing_id/filing_date were recorded lack those columns
+            return [
+                {column: row.get(column) or "" for column in FAILED_COLUMNS}
+                for row in csv.DictReader(f)
+            ]
+
+    def write_failed_records(self, failed_records, letters=None):
+        """
+        Writes failed holdings to <output_dir>/failed_holdings.csv so they can be retried later.
+        The file is removed when there is nothing left to record.
+        Keyword arguments:
+        failed_records: a list of dictionaries as produced by fetch_all_holdings
+        letters: if given, only the existing rows for managers starting with these letters are
+                 replaced and the rows for every other letter are kept. Otherwise the file is overwritten.
+        """
+        rows = []
+        if letters is not None:
+            letters = {letter.upper() for letter in letters}
+            rows = [
+                rec
+                for rec in self.read_failed_records()
+                if rec["fund_name"][:1].upper() not in letters
+            ]
+        rows.extend(failed_records)
+
+        if not rows:
+            if os.path.exists(self.failed_file):
+                os.remove(self.failed_file)
+                logger.info(f"No failed holdings left, removed {self.failed_file}")
+            return None
+
+        with open(self.failed_file, "w", newline="") as errorFile:
+            writer = csv.writer(errorFile)
+            writer.writerow(FAILED_COLUMNS)
+            logger.info("Failed records:")
+            for rec in failed_records:
+                logger.error(
+                    f"Manager: {rec['fund_name']}, Quarter: {rec['quarter']}, Error: {rec['error']}"
+                )
+            for rec in rows:
+                writer.writerow([rec.get(column, "") for column in FAILED_COLUMNS])
+        logger.info(f"Failed holdings logged to {self.failed_file}")
+        return self.failed_file
 
     async def get_managers_by_letter(
         self, manager_letter_url, session: aiohttp.ClientSession
@@ -186,23 +333,26 @@ class ThirteenFScraper:
         )
         return holdings_by_quarter, failed_records
 
-    def process_records(self, records, output_filename=None):
+    @staticmethod
+    def _sort_records(df):
+        df["filing_date"] = pd.to_datetime(df["filing_date"], errors="coerce")
+        return df.sort_values(
+            by=["fund_name", "stock_symbol", "filing_date"],
+            key=lambda col: col.str.lower() if col.dtype == "object" else col,
+        )
+
+    def build_dataframe(self, records):
         """
         Processes raw records using Pandas:
           - Converts to DataFrame
           - Sorts and groups the data
           - Computes the previous_shares, change, percentage_change
           - Infers the transaction_type
-          - Writes the final CSV file (excluding the temporary columns)
         Keyword arguments:
-        records: a list of holdings that are to be saved to the output csv file
+        records: a list of raw holding records (see RECORD_COLUMNS), or a DataFrame of them
+        Returns the processed DataFrame (excluding the temporary columns)
         """
-        df = pd.DataFrame(records)
-        df["filing_date"] = pd.to_datetime(df["filing_date"], errors="coerce")
-        df = df.sort_values(
-            by=["fund_name", "stock_symbol", "filing_date"],
-            key=lambda col: col.str.lower() if col.dtype == "object" else col,
-        )
+        df = self._sort_records(pd.DataFrame(records))
 
         # creating prev_shares column for calculation purposes
         df["prev_shares"] = df.groupby(["fund_name", "stock_symbol"])["shares"].shift(1)
@@ -253,11 +403,38 @@ class ThirteenFScraper:
 
         # remove temporary columns that are not required for final output
         df.drop(columns=["prev_shares", "new_holding"], inplace=True)
+        return df
 
-        df.to_csv(
-            output_filename if output_filename else self.output_filename, index=False
+    def process_records(self, records, output_filename=None):
+        """
+        Processes raw records (see build_dataframe) and writes the final file.
+        Keyword arguments:
+        records: a list of holdings that are to be saved to the output file
+        """
+        write_dataframe(
+            self.build_dataframe(records),
+            output_filename if output_filename else self.output_filename,
+            self.output_format,
         )
 
+    @staticmethod
+    def _holding_records(fund_name, filing, holdings):
+        """
+        Flattens the holdings of one filing into raw records (see RECORD_COLUMNS)
+        """
+        return [
+            {
+                "fund_name": fund_name,
+                "filing_date": filing.filing_date,
+                "quarter": filing.quarter,
+                "stock_symbol": holding.symbol,
+                "cl": holding.cl,
+                "value_($000)": holding.percentage,
+                "shares": holding.shares,
+            }
+            for holding in holdings
+        ]
+
     async def _process_manager_batch(
         self, letter: str, managers_list: list, session: aiohttp.ClientSession
     ):
@@ -265,7 +442,7 @@ class ThirteenFScraper:
         Common helper that processes a batch of managers for a given letter.
         Steps:
             1. Fetch filings concurrently.
-            2. For managers with filings, fetch holdings concurrently.
+            2. For managers with filings, fetch holdings concurrently, largest estimated manager first.
             3. Accumulate records.
             4. Process and write CSV file for the batch.
             5. Return number of records processed and list of failed records.
@@ -285,15 +462,29 @@ class ThirteenFScraper:
         ]
         await asyncio.gather(*tasks_filings)
 
-        # remove managers without filings.
-        managers_with_filings = [m for m in managers_list if m.filings]
+        # remove managers without filings, and dispatch the biggest ones first so they
+        # don't end up as the tail of the batch.
+        managers_with_filings, estimates = self.scheduler.order_managers(
+            [m for m in managers_list if m.filings]
+        )
         batch_records = []
         batch_failed = []
 
         if managers_with_filings:
+            progress = ProgressTracker(
+                f"Batch {letter}", sum(estimates), len(managers_with_filings)
+            )
+
+            async def fetch_with_progress(manager, estimate):
+                try:
+                    return await self.fetch_all_holdings(manager, session)
+                finally:
+                    progress.advance(estimate, manager.name)
+
             # get holdings for all managers concurrently
             holdings_tasks = [
-                self.fetch_all_holdings(m, session) for m in managers_with_filings
+                fetch_with_progress(m, estimate)
+                for m, estimate in zip(managers_with_filings, estimates)
             ]
             holdings_results = await asyncio.gather(
                 *holdings_tasks, return_exceptions=True
@@ -317,6 +508,7 @@ class ThirteenFScraper:
                 else:
                     holdings_by_quarter, failed_records = result
                     batch_failed.extend(failed_records)
+                    records_before = len(batch_records)
 
                     # process this manager's filings
                     for filing in manager.filings:
@@ -330,72 +522,113 @@ class ThirteenFScraper:
                             continue
 
                         # accumulate each holding record
-                        for holding in holdings:
-                            record = {
-                                "fund_name": manager.name,
-                                "filing_date": filing.filing_date,
-                                "quarter": filing.quarter,
-                                "stock_symbol": holding.symbol,
-                                "cl": holding.cl,
-                                "value_($000)": holding.percentage,
-                                "shares": holding.shares,
-                            }
-                            batch_records.append(record)
+                        batch_records.extend(
+                            self._holding_records(manager.name, filing, holdings)
+                        )
+
+                    # only quarters that were actually fetched say anything about the
+                    # manager's size; a run where everything failed must not shrink it
+                    if holdings_by_quarter:
+                        self.scheduler.record(
+                            manager,
+                            len(holdings_by_quarter),
+                            len(batch_records) - records_before,
+                        )
+
+            self.scheduler.save()
         else:
             logger.info(f"No managers with filings for letter: {letter}")
 
         if batch_records:
             # ensure batch directory exists.
-            batch_dir = os.path.join("data", "batches")
-            os.makedirs(batch_dir, exist_ok=True)
-            batch_filename = os.path.join(batch_dir, f"final_{letter}.csv")
-            self.process_records(batch_records, output_filename=batch_filename)
+            batch_filename = self._batch_filename(letter)
+            os.makedirs(os.path.dirname(batch_filename), exist_ok=True)
+            # pandas work runs in a thread so the other letter batches keep downloading
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.process_records, batch_records, batch_filename
+            )
             logger.info(f"Written {len(batch_records)} records to {batch_filename}")
         else:
             logger.warning(f"No records found for letter: {letter}.")
 
         return len(batch_records), batch_failed
 
-    async def run_batch(self, letter):
+    async def run_batches(self, letters):
         """
-        Processes managers for by a specific letter:
-        1. Retrieve manager data for the specified letter.
-        2. For each manager, concurrently fetch filings and then API holdings.
-        3. Accumulate records for this batch.
-        4. Use Pandas to process the records and infer transaction types.
-        5. Write the processed records to a batch CSV file.
-        6. Log any failed holdings.
+        Processes managers for the specified letters:
+        1. Retrieve manager data for each letter.
+        2. Order the letters by estimated size and process up to parallel_letters of them at once,
+           concurrently fetching filings and then API holdings for each manager.
+        3. Use Pandas to process each batch's records and infer transaction types.
+        4. Write the processed records to one batch file per letter.
+        5. Log any failed holdings, replacing these letters' rows in failed_holdings.csv.
 
         Keyword Arguments:
-        letter - A single letter to fetch all managers with
+        letters - single letters to fetch all managers with
+        Returns the list of failed holding records for these batches
         """
-        logger.info(f"Starting batch run for letter: {letter.upper()}")
+        letters = [letter.upper() for letter in letters]
+        logger.info(f"Starting batch run for letters: {', '.join(letters)}")
         failed_records_total = []
-        async with aiohttp.ClientSession(
-            headers={"User-Agent": "Mozilla/5.0 (compatible; DataScraper/1.0)"}
-        ) as session:
+        async with self._create_session() as session:
             start_time = time.time()
 
-            # retrieve managers only for the specified letter.
-            managers_list = await self.get_managers_by_letter(
-                self.managers_url + letter, session
+            # retrieve managers only for the specified letters.
+            manager_lists = await asyncio.gather(
+                *[
+                    self.get_managers_by_letter(
+                        self.managers_url + letter.lower(), session
+                    )
+                    for letter in letters
+                ]
             )
-            if not managers_list:
-                logger.warning(f"No managers found for letter '{letter}'.")
-                return
+            managers_by_letter = {}
+            for letter, managers_list in zip(letters, manager_lists):
+                if managers_list:
+                    managers_by_letter[letter] = managers_list
+                else:
+                    logger.warning(f"No managers found for letter '{letter}'.")
 
-            batch_holding_count, failed_holding_count = (
-                await self._process_manager_batch(
-                    letter.upper(), managers_list, session
-                )
+            batches = self.scheduler.order_letters(managers_by_letter)
+            progress = ProgressTracker(
+                "Batches", sum(estimate for _, _, estimate in batches), len(batches)
             )
+            results = await self._run_largest_first(
+                batches,
+                lambda letter, managers_list: self._process_manager_batch(
+                    letter, managers_list, session
+                ),
+                progress,
+            )
+
+            total_records = 0
+            for (_, managers_list, _), result in zip(batches, results):
+                if isinstance(result, Exception):
+                    failed_records_total.extend(
+                        self._failed_batch_records(managers_list, result)
+                    )
+                    continue
+                records_count, batch_failed = result
+                total_records += records_count
+                failed_records_total.extend(batch_failed)
 
             end_time = time.time()
 
             logger.info(
-                f"Batch for letter {letter.upper()} completed in {round((end_time - start_time) / 60)} minutes \nTotal holdings processed: {batch_holding_count}\nFailed holdings count: {len(failed_holding_count)}"
+                f"Batches {', '.join(letters)} completed in {round((end_time - start_time) / 60)} minutes \nTotal holdings processed: {total_records}\nFailed holdings count: {len(failed_records_total)}"
             )
 
+        # letters whose page failed to load were not re-scraped, so their old failures stay
+        self.write_failed_records(failed_records_total, letters=list(managers_by_letter))
+        return failed_records_total
+
+    async def run_batch(self, letter):
+        """
+        Processes managers for a specific letter (see run_batches).
+        Returns the list of failed holding records for this batch
+        """
+        return await self.run_batches([letter])
+
     async def run(self):
         """
         Main pipeline:
@@ -409,9 +642,7 @@ class ThirteenFScraper:
         logger.info("Starting full scraping pipeline...")
         failed_records_total = []
         total_records = 0
-        async with aiohttp.ClientSession(
-            headers={"User-Agent": "Mozilla/5.0 (compatible; DataScraper/1.0)"}
-        ) as session:
+        async with self._create_session() as session:
             batch_start_time = time.time()
 
             managers = await self.get_managers(session)
@@ -422,20 +653,33 @@ class ThirteenFScraper:
                 initial = manager.name[0].upper()
                 managers_by_letter[initial].append(manager)
 
-            # Process managers by letter
-            for letter, managers_list in managers_by_letter.items():
+            # Process letters in parallel, largest estimated batch first
+            batches = self.scheduler.order_letters(managers_by_letter)
+            progress = ProgressTracker(
+                "Full scrape", sum(estimate for _, _, estimate in batches), len(batches)
+            )
+
+            async def process_letter(letter, managers_list):
                 logger.info(
                     f"\n=== Processing batch for letter: {letter} with {len(managers_list)} managers ==="
                 )
+                return await self._process_manager_batch(letter, managers_list, session)
 
-                records_count, batch_failed = await self._process_manager_batch(
-                    letter, managers_list, session
-                )
+            results = await self._run_largest_first(batches, process_letter, progress)
+            for (_, managers_list, _), result in zip(batches, results):
+                if isinstance(result, Exception):
+                    failed_records_total.extend(
+                        self._failed_batch_records(managers_list, result)
+                    )
+                    continue
+                records_count, batch_failed = result
                 total_records += records_count
                 failed_records_total.extend(batch_failed)
 
             if total_records == 0:
                 logger.warning("No records fetched. Exiting...")
+                if failed_records_total:
+                    self.write_failed_records(failed_records_total)
                 return
 
             total_time = time.time() - batch_start_time
@@ -447,17 +691,186 @@ class ThirteenFScraper:
             )
 
             logger.info(f"Total failed holdings: {len(failed_records_total)}")
-            if failed_records_total:
-                failed_file = os.path.join("data", "failed_holdings.csv")
-                with open(failed_file, "w", newline="") as errorFile:
-                    writer = csv.writer(errorFile)
-                    writer.writerow(["fund_name", "quarter", "error"])
-                    logger.info("Failed records:")
-                    for rec in failed_records_total:
-                        logger.error(
-                            f"Manager: {rec['fund_name']}, Quarter: {rec['quarter']}, Error: {rec['error']}"
-                        )
-                        writer.writerow(
-                            [rec["fund_name"], rec["quarter"], rec["error"]]
+            self.write_failed_records(failed_records_total)
+
+    def _merge_manager_rows(self, letter, records, rescraped):
+        """
+        Rewrites only the affected managers' rows in the batch file of a letter.
+        Derived columns (change, pct_change, ...) depend on a manager's previous quarters, so
+        the raw rows already on disk for a manager are recombined with the new ones and the
+        manager is processed again.
+        Keyword arguments:
+        letter: the batch whose file is updated
+        records: new raw records (see RECORD_COLUMNS)
+        rescraped: names of managers whose filings were all fetched again; their existing rows are discarded
+        """
+        batch_filename = self._batch_filename(letter)
+        affected = {rec["fund_name"] for rec in records} | set(rescraped)
+        if not affected:
+            return
+
+        # new records hold the site's raw date strings while the batch file holds the
+        # normalised dates build_dataframe wrote, so each is parsed on its own before
+        # combining; a single to_datetime call would turn the mismatched format into NaT.
+        new_raw = pd.DataFrame(records, columns=RECORD_COLUMNS)
+        new_raw["filing_date"] = pd.to_datetime(new_raw["filing_date"], errors="coerce")
+        raw_frames = [new_raw]
+        frames = []
+        if os.path.exists(batch_filename):
+            existing = read_dataframe(batch_filename, self.output_format)
+            existing["filing_date"] = pd.to_datetime(
+                existing["filing_date"], errors="coerce"
+            )
+            affected_mask = existing["fund_name"].isin(affected)
+            frames.append(existing.loc[~affected_mask].copy())
+
+            # reuse the quarters that succeeded previously for managers retried per filing
+            retried_quarters = {(rec["fund_name"], rec["quarter"]) for rec in records}
+            reused = existing.loc[
+                affected_mask & ~existing["fund_name"].isin(rescraped), RECORD_COLUMNS
+            ]
+            raw_frames.append(
+                reused[
+                    [
+                        key not in retried_quarters
+                        for key in zip(reused["fund_name"], reused["quarter"])
+                    ]
+                ]
+            )
+
+        raw_frames = [frame for frame in raw_frames if not frame.empty]
+        if raw_frames:
+            frames.append(self.build_dataframe(pd.concat(raw_frames, ignore_index=True)))
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            logger.warning(f"No records left for letter {letter}, not writing a batch file")
+            return
+
+        df = self._sort_records(pd.concat(frames, ignore_index=True))
+        os.makedirs(os.path.dirname(batch_filename), exist_ok=True)
+        write_dataframe(df, batch_filename, self.output_format)
+        logger.info(
+            f"Rewrote {len(affected)} managers in {batch_filename} ({len(df)} records)"
+        )
+
+    async def _retry_letter(self, letter, failed_rows, session):
+        """
+        Retries the failed holdings of one letter batch.
+        Rows with a filing_id are retried per filing. Rows without one (the manager failed as a
+        whole, or the file predates filing_id) have the manager page scraped again.
+        Returns the list of records that still failed
+        """
+        still_failed = []
+        records = []
+        rescraped = set()
+
+        # managers that failed as a whole are scraped again entirely, which also covers
+        # any of their per-filing failures
+        names = {row["fund_name"] for row in failed_rows if not row["filing_id"]}
+        per_filing = [
+            row
+            for row in failed_rows
+            if row["filing_id"] and row["fund_name"] not in names
+        ]
+        results = await asyncio.gather(
+            *[
+                self.api_client.fetch_holdings(row["filing_id"], session)
+                for row in per_filing
+            ],
+            return_exceptions=True,
+        )
+        for row, res in zip(per_filing, results):
+            if isinstance(res, Exception):
+                still_failed.append(dict(row, error=str(res)))
+            else:
+                filing = Filing(row["quarter"], row["filing_date"], row["filing_id"])
+                records.extend(self._holding_records(row["fund_name"], filing, res))
+
+        if names:
+            managers = []
+            if letter.isalpha():
+                managers = [
+                    m
+                    for m in await self.get_managers_by_letter(
+                        self.managers_url + letter.lower(), session
+                    )
+                    if m.name in names
+                ]
+            missing = names - {m.name for m in managers}
+            if missing:
+                logger.warning(
+                    f"Could not find manager page(s) for {', '.join(sorted(missing))}; keeping them as failed"
+                )
+                still_failed.extend(
+                    row for row in failed_rows if row["fund_name"] in missing
+                )
+
+            for manager in managers:
+                manager_rows = [
+                    row for row in failed_rows if row["fund_name"] == manager.name
+                ]
+                try:
+                    await self.get_filings_for_manager(manager, session)
+                    if not manager.filings:
+                        # the filings table didn't load; dropping the manager's rows now
+                        # would lose it from both the batch file and the retry list
+                        logger.warning(
+                            f"No filings found when re-scraping {manager.name}; keeping it as failed"
                         )
-                logger.info(f"Failed holdings logged to {failed_file}")
+                        still_failed.extend(manager_rows)
+                        continue
+                    holdings_by_quarter, failed_records = await self.fetch_all_holdings(
+                        manager, session
+                    )
+                except Exception as e:
+                    logger.error(f"Error re-scraping {manager.name}: {e}")
+                    still_failed.extend(dict(row, error=str(e)) for row in manager_rows)
+                    continue
+                still_failed.extend(failed_records)
+                rescraped.add(manager.name)
+                for filing, holdings in holdings_by_quarter.items():
+                    records.extend(self._holding_records(manager.name, filing, holdings))
+
+        self._merge_manager_rows(letter, records, rescraped)
+        return still_failed
+
+    async def retry_failed(self):
+        """
+        Retries the holdings listed in failed_holdings.csv and rewrites only the affected
+        managers' rows in their batch files, instead of re-scraping whole letters.
+        Returns the list of records that still failed (also written back to failed_holdings.csv)
+        """
+        failed_rows = self.read_failed_records()
+        if not failed_rows:
+            logger.info("No failed holdings to retry.")
+            return []
+
+        # batches are keyed by the manager's initial, the same way run() groups them
+        rows_by_letter = defaultdict(list)
+        for row in failed_rows:
+            rows_by_letter[row["fund_name"][:1].upper()].append(row)
+
+        logger.info(
+            f"Retrying {len(failed_rows)} failed holdings across {len(rows_by_letter)} batches"
+        )
+        # most failed rows first; cost history doesn't apply since only failed filings are fetched
+        batches = sorted(
+            ((letter, rows, len(rows)) for letter, rows in rows_by_letter.items()),
+            key=lambda batch: batch[2],
+            reverse=True,
+        )
+        still_failed = []
+        async with self._create_session() as session:
+            results = await self._run_largest_first(
+                batches,
+                lambda letter, rows: self._retry_letter(letter, rows, session),
+            )
+        for (_, rows, _), result in zip(batches, results):
+            # a letter that failed outright keeps its original rows for the next retry
+            still_failed.extend(rows if isinstance(result, Exception) else result)
+
+        logger.info(
+            f"Retry finished: {len(failed_rows) - len(still_failed)} recovered, {len(still_failed)} still failing"
+        )
+        self.write_failed_records(still_failed)
+        return still_failed
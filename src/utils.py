@@ -1,26 +1,92 @@
 import os, glob, logging, time
-import pandas as pd
+
+# pandas is imported inside the functions that need it so that lightweight
+# commands (e.g. stats) don't pay its import cost on startup.
 
 logger = logging.getLogger(__name__)
 
+SUPPORTED_FORMATS = ("csv", "parquet")
+
+
+def read_dataframe(path, file_format="csv"):
+    """
+    Reads a batch file written by write_dataframe.
+
+    Parameters:
+        path (str): The file to read.
+        file_format (str): One of SUPPORTED_FORMATS.
+
+    Returns:
+        pd.DataFrame: The file contents.
+    """
+    import pandas as pd
+
+    if file_format == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def write_dataframe(df, path, file_format="csv"):
+    """
+    Writes a DataFrame to disk in the requested format.
+
+    Parameters:
+        df (pd.DataFrame): The data to write.
+        path (str): The destination file.
+        file_format (str): One of SUPPORTED_FORMATS (parquet requires pyarrow).
+    """
+    if file_format == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def collect_batch_stats(input_directory="data/batches", batch_pattern="final_*.*"):
+    """
+    Summarises the batch files on disk using only the standard library.
+
+    Parameters:
+        input_directory (str): The directory where batch files are stored.
+        batch_pattern (str): The glob pattern to match batch files.
+
+    Returns:
+        list[dict]: One entry per batch file with its name, size in bytes and
+        row count (None for non-CSV files).
+    """
+    stats = []
+    for file in sorted(glob.glob(os.path.join(input_directory, batch_pattern))):
+        rows = None
+        if file.endswith(".csv"):
+            with open(file, "rb") as f:
+                # subtract the header line
+                rows = max(sum(1 for _ in f) - 1, 0)
+        stats.append(
+            {"file": file, "size_bytes": os.path.getsize(file), "rows": rows}
+        )
+    return stats
+
 
 def merge_batch_files(
     input_directory="data",
     batch_pattern="final_*.csv",
     output_file="data/final_merged.csv",
+    file_format="csv",
 ):
     """
-    Merges all batch CSV files from the specified directory into one final CSV file.
+    Merges all batch files from the specified directory into one final file.
 
     Parameters:
         input_directory (str): The directory where batch files are stored.
-        batch_pattern (str): The glob pattern to match batch CSV files.
-        output_file (str): The path for storing the merged CSV.
+        batch_pattern (str): The glob pattern to match batch files.
+        output_file (str): The path for storing the merged file.
+        file_format (str): One of SUPPORTED_FORMATS, used for both the batch files and the merged output.
 
     Returns:
         pd.DataFrame: The final merged DataFrame (None if no files were found).
     """
 
+    import pandas as pd
+
     # Use glob to find all files matching the pattern in the specified directory.
     file_pattern = os.path.join(input_directory, batch_pattern)
     batch_files = glob.glob(file_pattern)
@@ -35,7 +101,7 @@ def merge_batch_files(
     logger.info(f"Started merging batch files")
     for file in batch_files:
         try:
-            df = pd.read_csv(file)
+            df = read_dataframe(file, file_format)
             dataframes.append(df)
             logger.info(f"Read {len(df)} records from {file}")
         except Exception as e:
@@ -49,7 +115,7 @@ def merge_batch_files(
     merged_df = pd.concat(dataframes, ignore_index=True)
 
     # Write the merged DataFrame to the output CSV.
-    merged_df.to_csv(output_file, index=False)
+    write_dataframe(merged_df, output_file, file_format)
     logger.info(
         f"Completed merging batch files in {round((time.time() - start_time) / 60, 2)} minutes"
     )
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.setenv("BASE_URL", "http://example.test")
+    monkeypatch.setenv("BASE_API_URL", "http://example.test/api/")
+    from src.scraper import ThirteenFScraper
+
+    return ThirteenFScraper(output_dir=str(tmp_path))
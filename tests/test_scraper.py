@@ -0,0 +1,110 @@
+import asyncio, os
+
+import pandas as pd
+
+from src.models import Filing, Holding, Manager
+
+
+def _records(scraper, fund_name, quarter, filing_date, shares):
+    filing = Filing(quarter, filing_date, quarter)
+    return scraper._holding_records(
+        fund_name, filing, [Holding("AAPL", "COM", "", "10", shares)]
+    )
+
+
+def test_merge_manager_rows_recomputes_around_retried_middle_quarter(scraper):
+    batch_filename = scraper._batch_filename("A")
+    os.makedirs(os.path.dirname(batch_filename))
+    scraper.process_records(
+        _records(scraper, "Alpha", "Q1 2020", "2/14/2020", 100)
+        + _records(scraper, "Alpha", "Q3 2020", "8/14/2020", 300)
+        + _records(scraper, "Acme", "Q1 2020", "2/14/2020", 50),
+        output_filename=batch_filename,
+    )
+
+    scraper._merge_manager_rows(
+        "A", _records(scraper, "Alpha", "Q2 2020", "5/15/2020", 200), set()
+    )
+
+    df = pd.read_csv(batch_filename)
+    alpha = df[df["fund_name"] == "Alpha"].set_index("quarter")
+    assert list(alpha.index) == ["Q1 2020", "Q2 2020", "Q3 2020"]
+    assert alpha["filing_date"].tolist() == ["2020-02-14", "2020-05-15", "2020-08-14"]
+    assert alpha.loc["Q1 2020", "inferred_transaction_type"] == "new_buy"
+    assert alpha.loc["Q2 2020", "inferred_transaction_type"] == "buy"
+    assert alpha.loc["Q2 2020", "pct_change"] == 100.0
+    assert alpha.loc["Q3 2020", "change"] == 100
+    assert alpha.loc["Q3 2020", "pct_change"] == 50.0
+    # managers that were not retried are left untouched
+    assert df[df["fund_name"] == "Acme"]["shares"].tolist() == [50]
+
+
+def test_run_batches_keeps_failures_of_letters_that_did_not_load(scraper):
+    scraper.write_failed_records(
+        [
+            {"fund_name": "Alpha", "filing_id": "1", "quarter": "Q1", "filing_date": "", "error": "x"},
+            {"fund_name": "Beta", "filing_id": "2", "quarter": "Q1", "filing_date": "", "error": "x"},
+        ]
+    )
+
+    async def get_managers_by_letter(url, session):
+        # the page for B fails to load
+        return [Manager("Alpha", "http://example.test/alpha")] if url.endswith("a") else []
+
+    async def process_manager_batch(letter, managers_list, session):
+        return 1, []
+
+    scraper.get_managers_by_letter = get_managers_by_letter
+    scraper._process_manager_batch = process_manager_batch
+    asyncio.run(scraper.run_batches(["A", "B"]))
+
+    assert [rec["fund_name"] for rec in scraper.read_failed_records()] == ["Beta"]
+
+
+def test_retry_keeps_manager_whose_filings_did_not_load(scraper):
+    failed_rows = [
+        {"fund_name": "Alpha", "filing_id": "", "quarter": "all", "filing_date": "", "error": "x"}
+    ]
+
+    async def get_managers_by_letter(url, session):
+        return [Manager("Alpha", "http://example.test/alpha")]
+
+    async def get_filings_for_manager(manager, session):
+        return None  # filings table missing, manager.filings stays empty
+
+    scraper.get_managers_by_letter = get_managers_by_letter
+    scraper.get_filings_for_manager = get_filings_for_manager
+
+    merged = []
+    scraper._merge_manager_rows = lambda letter, records, rescraped: merged.append(
+        rescraped
+    )
+    still_failed = asyncio.run(scraper._retry_letter("A", failed_rows, None))
+
+    assert still_failed == failed_rows
+    assert merged == [set()]
+
+
+def test_run_batches_records_failed_letter_without_losing_siblings(scraper):
+    scraper.parallel_letters = 3
+    finished = []
+
+    async def get_managers_by_letter(url, session):
+        letter = url[-1].upper()
+        return [Manager(f"{letter}{i}", None) for i in range(3 if letter == "B" else 1)]
+
+    async def process_manager_batch(letter, managers_list, session):
+        if letter == "B":
+            raise RuntimeError("manager page returned 503")
+        await asyncio.sleep(0.01)
+        finished.append(letter)
+        return 1, []
+
+    scraper.get_managers_by_letter = get_managers_by_letter
+    scraper._process_manager_batch = process_manager_batch
+    asyncio.run(scraper.run_batches(["A", "B", "C"]))
+
+    assert sorted(finished) == ["A", "C"]
+    failed = scraper.read_failed_records()
+    assert [rec["fund_name"] for rec in failed] == ["B0", "B1", "B2"]
+    assert {rec["quarter"] for rec in failed} == {"all"}